@@ -1,5 +1,9 @@
+import time
 import streamlit as st
-from utils import load_candidate_data, get_latest_candidates
+from utils import CandidateFeed, get_latest_candidates
+
+# Seconds between polls of the change feed
+REFRESH_SECONDS = 5
 
 st.set_page_config(
     page_title="TalentScout Admin", 
@@ -10,8 +14,25 @@ st.set_page_config(
 st.title("📊 TalentScout Admin Dashboard")
 st.markdown("---")
 
-# Load all candidates
-candidates = load_candidate_data()
+@st.cache_resource
+def get_feed():
+    return CandidateFeed()
+
+feed = get_feed()
+feed.refresh()
+st.session_state.seen_sequence = feed.sequence
+
+@st.experimental_fragment(run_every=REFRESH_SECONDS)
+def live_updates():
+    # Only reads log entries newer than the last poll; rerun the page when there are any
+    feed.refresh()
+    if feed.sequence != st.session_state.seen_sequence:
+        st.rerun()
+    st.caption(f"🟢 Live · checked {time.strftime('%H:%M:%S')}")
+
+live_updates()
+
+candidates = feed.candidates
 
 if not candidates:
     st.info("No candidates found.")
@@ -19,8 +40,35 @@ if not candidates:
 
 st.write(f"**Total Candidates:** {len(candidates)}")
 
+# Candidate search
+st.subheader("🔎 Search Candidates")
+
+with st.form("search_form"):
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        required_skills = st.text_input("Required skills (comma-separated):", placeholder="Kafka, Go")
+    with col2:
+        min_experience = st.number_input("Min. experience (years):", min_value=0, step=1)
+    job_description = st.text_area("Paste a job description to rank candidates (optional):")
+    searched = st.form_submit_button("Search")
+
+if searched:
+    skills = [skill.strip() for skill in required_skills.split(",") if skill.strip()]
+    start = time.perf_counter()
+    results = feed.search(job_description, skills, min_experience, limit=20)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    st.caption(f"{len(results)} matches in {elapsed_ms:.1f} ms")
+    for candidate, score in results:
+        st.write(f"**{candidate['name']}** - {candidate['position']} · {candidate['experience']} years · "
+                 f"{candidate['location']} · score {score:.2f}")
+        st.caption(candidate['tech_stack'])
+
+st.markdown("---")
+st.subheader("🕒 Recent Candidates")
+
 # Show recent candidates
-recent_candidates = get_latest_candidates(10)
+recent_candidates = get_latest_candidates(10, candidates)
 
 for idx, candidate in enumerate(recent_candidates):
     with st.expander(f"📋 {candidate['name']} - {candidate['position']} ({candidate.get('timestamp', 'No date')[:10]})"):
@@ -0,0 +1,288 @@
+"""Headless intake API for TalentScout.
+
+A small asyncio HTTP/1.1 server (stdlib only) exposing the same intake flow
+as app.py, for partner portals and high-volume campaigns:
+
+    POST /applications                    submit a candidate profile
+    GET  /applications/<token>[?wait=N]   poll status and generated questions,
+                                          optionally waiting up to N seconds
+    POST /applications/<token>/finalize   save the candidate (409 if a duplicate)
+    GET  /health
+
+Run with:
+    python api.py --port 8000
+"""
+import argparse
+import asyncio
+import json
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Optional, Dict, Any, Tuple
+
+from prompts import generate_questions
+from utils import (validate_email, validate_phone, save_candidate,
+                   SAVE_SAVED, SAVE_DUPLICATE, SAVE_IN_PROGRESS, SAVE_FAILED)
+
+TEXT_FIELDS = ("name", "position", "location", "tech_stack")
+# Unfinished applications are dropped after this many seconds
+APPLICATION_TTL = 2 * 60 * 60
+MAX_BODY_BYTES = 64 * 1024
+# Longest a status request may wait for questions to be generated
+MAX_WAIT_SECONDS = 30
+# Threads for the blocking question generation and file writes
+WORKER_THREADS = 32
+
+class IntakeError(Exception):
+    """A request error reported to the client with an HTTP status"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def validate_profile(payload: Any) -> Dict[str, Any]:
+    """Validate a submitted profile with the same rules as the Streamlit form"""
+    if not isinstance(payload, dict):
+        raise IntakeError(HTTPStatus.BAD_REQUEST, "Expected a JSON object.")
+
+    data = {}
+    for field in TEXT_FIELDS:
+        value = str(payload.get(field) or "").strip()
+        if not value:
+            raise IntakeError(HTTPStatus.UNPROCESSABLE_ENTITY, f"Missing field: {field}")
+        data[field] = value
+
+    email = str(payload.get("email") or "").strip()
+    if not validate_email(email):
+        raise IntakeError(HTTPStatus.UNPROCESSABLE_ENTITY, "Please enter a valid email address.")
+    data["email"] = email
+
+    phone = str(payload.get("phone") or "").strip()
+    if not validate_phone(phone):
+        raise IntakeError(HTTPStatus.UNPROCESSABLE_ENTITY, "Please enter a valid 10-digit phone number.")
+    data["phone"] = phone
+
+    try:
+        experience = int(payload.get("experience", 0))
+    except (TypeError, ValueError):
+        experience = -1
+    if experience < 0:
+        raise IntakeError(HTTPStatus.UNPROCESSABLE_ENTITY, "Experience must be a non-negative integer.")
+    data["experience"] = experience
+
+    # Keep the same key order as the Streamlit step machine
+    return {key: data[key] for key in ("name", "email", "phone", "experience",
+                                       "position", "location", "tech_stack")}
+
+class IntakeService:
+    """In-progress applications and the intake steps, independent of HTTP"""
+
+    def __init__(self, filename: str = "data/candidates.json",
+                 executor: Optional[ThreadPoolExecutor] = None):
+        self.filename = filename
+        self.executor = executor or ThreadPoolExecutor(max_workers=WORKER_THREADS)
+        self.applications: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _cleanup_expired(self) -> None:
+        """Drop expired applications (oldest first, so this stops early)"""
+        cutoff = time.time() - APPLICATION_TTL
+        while self.applications:
+            token, application = next(iter(self.applications.items()))
+            if application["created"] >= cutoff:
+                break
+            self.applications.popitem(last=False)
+
+    def _get(self, token: str) -> Dict[str, Any]:
+        application = self.applications.get(token)
+        if application is None:
+            raise IntakeError(HTTPStatus.NOT_FOUND, "Unknown application token.")
+        return application
+
+    async def submit(self, payload: Any) -> Dict[str, Any]:
+        data = validate_profile(payload)
+        self._cleanup_expired()
+
+        token = secrets.token_urlsafe(16)
+        application = {"data": data, "status": "generating", "created": time.time()}
+        self.applications[token] = application
+        application["task"] = asyncio.get_running_loop().create_task(self._generate(application))
+        return {"token": token, "status": application["status"]}
+
+    async def _generate(self, application: Dict[str, Any]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            questions = await loop.run_in_executor(
+                self.executor, generate_questions, application["data"]["tech_stack"])
+            application["data"]["questions"] = questions
+            application["status"] = "ready"
+        except Exception as e:
+            print(f"❌ Error generating questions: {str(e)}")
+            application["status"] = "failed"
+
+    async def status(self, token: str, wait: float = 0) -> Dict[str, Any]:
+        application = self._get(token)
+        if wait > 0 and application["status"] == "generating":
+            try:
+                await asyncio.wait_for(asyncio.shield(application["task"]), min(wait, MAX_WAIT_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+        return {
+            "token": token,
+            "status": application["status"],
+            "questions": application["data"].get("questions"),
+        }
+
+    async def finalize(self, token: str) -> Dict[str, Any]:
+        application = self._get(token)
+        if application["status"] == "saved":
+            return {"token": token, "status": "saved"}
+        if application["status"] == "duplicate":
+            raise IntakeError(HTTPStatus.CONFLICT, "A candidate with these details already exists.")
+        if application["status"] not in ("ready", "saving"):
+            raise IntakeError(HTTPStatus.CONFLICT, "Questions have not been generated yet.")
+
+        # Overlapping finalize calls (double clicks, client retries) share one save
+        save = application.get("save")
+        if save is None:
+            application["status"] = "saving"
+            save = application["save"] = asyncio.get_running_loop().create_task(self._save(application))
+        outcome = await asyncio.shield(save)
+        if outcome == SAVE_DUPLICATE:
+            raise IntakeError(HTTPStatus.CONFLICT, "A candidate with these details already exists.")
+        if outcome == SAVE_IN_PROGRESS:
+            raise IntakeError(HTTPStatus.CONFLICT, "A save for this candidate is already in progress.")
+        if outcome != SAVE_SAVED:
+            raise IntakeError(HTTPStatus.INTERNAL_SERVER_ERROR, "Failed to save candidate data.")
+        return {"token": token, "status": "saved"}
+
+    async def _save(self, application: Dict[str, Any]) -> str:
+        loop = asyncio.get_running_loop()
+        try:
+            outcome = await loop.run_in_executor(
+                self.executor, save_candidate, application["data"], self.filename)
+        except Exception as e:
+            print(f"❌ Error saving candidate: {str(e)}")
+            outcome = SAVE_FAILED
+
+        if outcome == SAVE_SAVED:
+            application["status"] = "saved"
+        elif outcome == SAVE_DUPLICATE:
+            application["status"] = "duplicate"
+        else:
+            # Nothing was written, so a later finalize may try again
+            application["status"] = "ready"
+            del application["save"]
+        return outcome
+
+class IntakeServer:
+    """Minimal keep-alive HTTP/1.1 front end for IntakeService"""
+
+    def __init__(self, service: IntakeService):
+        self.service = service
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        path, _, query = path.partition("?")
+        parts = [part for part in path.split("/") if part]
+        try:
+            if parts == ["health"] and method == "GET":
+                return HTTPStatus.OK, {"status": "ok"}
+            if parts == ["applications"] and method == "POST":
+                return HTTPStatus.ACCEPTED, await self.service.submit(_parse_json(body))
+            if len(parts) == 2 and parts[0] == "applications" and method == "GET":
+                return HTTPStatus.OK, await self.service.status(parts[1], _parse_wait(query))
+            if len(parts) == 3 and parts[0] == "applications" and parts[2] == "finalize" and method == "POST":
+                return HTTPStatus.OK, await self.service.finalize(parts[1])
+            raise IntakeError(HTTPStatus.NOT_FOUND, "Not found.")
+        except IntakeError as e:
+            return e.status, {"error": e.message}
+        except Exception as e:
+            print(f"❌ Error handling {method} {path}: {str(e)}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    writer.write(_response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                           {"error": "Request body too large."}, keep_alive=False))
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                keep_alive = (version == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                status, payload = await self.dispatch(method, path, body)
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+def _parse_json(body: bytes) -> Any:
+    try:
+        return json.loads(body or b"null")
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise IntakeError(HTTPStatus.BAD_REQUEST, "Request body must be valid JSON.")
+
+def _parse_wait(query: str) -> float:
+    for name, _, value in (pair.partition("=") for pair in query.split("&")):
+        if name == "wait":
+            try:
+                return max(float(value), 0)
+            except ValueError:
+                raise IntakeError(HTTPStatus.BAD_REQUEST, "wait must be a number of seconds.")
+    return 0
+
+def _response(status: HTTPStatus, payload: Dict[str, Any], keep_alive: bool) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+async def start_server(host: str = "127.0.0.1", port: int = 8000,
+                       filename: str = "data/candidates.json") -> asyncio.AbstractServer:
+    """Start the intake API and return the running asyncio server"""
+    server = IntakeServer(IntakeService(filename))
+    return await asyncio.start_server(server.handle_connection, host, port)
+
+async def serve(host: str = "127.0.0.1", port: int = 8000,
+                filename: str = "data/candidates.json") -> None:
+    server = await start_server(host, port, filename)
+    print(f"🚀 TalentScout intake API listening on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TalentScout headless intake API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--data", default="data/candidates.json", help="candidates JSON file")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.data))
+    except KeyboardInterrupt:
+        pass
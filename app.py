@@ -1,26 +1,46 @@
 import streamlit as st
 from prompts import generate_greeting, generate_questions
 from utils import validate_email, validate_phone, save_candidate_data
+from sessions import SessionStore
 
 st.set_page_config(page_title="TalentScout - Hiring Assistant", page_icon="🤖", layout="centered")
 st.title("🤖 TalentScout Hiring Assistant")
 
-# Initialize session state
-if "step" not in st.session_state:
-    st.session_state.step = "greet"
-    st.session_state.data = {}
+@st.cache_resource
+def get_session_store():
+    return SessionStore()
+
+store = get_session_store()
+
+# Only the session token lives in session state; the application itself is loaded
+# from the store on every rerun, so idle sessions hold no candidate data in memory
+token = st.session_state.get("session_token") or st.query_params.get("session")
+session = store.load(token) if token else None
+if session is None:
+    token = store.create(data={"candidate": {}, "saved": False})
+    session = ("greet", {"candidate": {}, "saved": False})
+st.session_state.session_token = token
+if st.query_params.get("session") != token:
+    st.query_params["session"] = token
+step, state = session
+data = state.setdefault("candidate", {})
+
+def save_session():
+    store.save(token, step, state)
 
 def next_step(step_name):
-    st.session_state.step = step_name
+    global step
+    step = step_name
+    save_session()
 
 # Step 1: Greeting
-if st.session_state.step == "greet":
+if step == "greet":
     with st.chat_message("assistant"):
         st.markdown(generate_greeting())
     next_step("name")
 
 # Step 2: Name
-if st.session_state.step == "name":
+if step == "name":
     with st.form("name_form"):
         name = st.text_input("Enter your full name:")
         submitted = st.form_submit_button("Next")
@@ -28,11 +48,11 @@ if st.session_state.step == "name":
             if name.strip() == "":
                 st.warning("Please enter your name.")
             else:
-                st.session_state.data["name"] = name.strip()
+                data["name"] = name.strip()
                 next_step("email")
 
 # Step 3: Email
-if st.session_state.step == "email":
+if step == "email":
     with st.form("email_form"):
         email = st.text_input("Enter your email address:")
         submitted = st.form_submit_button("Next")
@@ -40,11 +60,11 @@ if st.session_state.step == "email":
             if not validate_email(email.strip()):
                 st.warning("Please enter a valid email address.")
             else:
-                st.session_state.data["email"] = email.strip()
+                data["email"] = email.strip()
                 next_step("phone")
 
 # Step 4: Phone Number
-if st.session_state.step == "phone":
+if step == "phone":
     with st.form("phone_form"):
         phone = st.text_input("Enter your 10-digit phone number:")
         submitted = st.form_submit_button("Next")
@@ -52,20 +72,20 @@ if st.session_state.step == "phone":
             if not validate_phone(phone.strip()):
                 st.warning("Please enter a valid 10-digit phone number.")
             else:
-                st.session_state.data["phone"] = phone.strip()
+                data["phone"] = phone.strip()
                 next_step("experience")
 
 # Step 5: Years of Experience
-if st.session_state.step == "experience":
+if step == "experience":
     with st.form("experience_form"):
         experience = st.number_input("Enter your years of experience:", min_value=0, step=1)
         submitted = st.form_submit_button("Next")
         if submitted:
-            st.session_state.data["experience"] = int(experience)
+            data["experience"] = int(experience)
             next_step("position")
 
 # Step 6: Desired Position(s)
-if st.session_state.step == "position":
+if step == "position":
     with st.form("position_form"):
         position = st.text_input("Enter your desired position(s):")
         submitted = st.form_submit_button("Next")
@@ -73,11 +93,11 @@ if st.session_state.step == "position":
             if position.strip() == "":
                 st.warning("Please enter a position.")
             else:
-                st.session_state.data["position"] = position.strip()
+                data["position"] = position.strip()
                 next_step("location")
 
 # Step 7: Current Location
-if st.session_state.step == "location":
+if step == "location":
     with st.form("location_form"):
         location = st.text_input("Enter your current location:")
         submitted = st.form_submit_button("Next")
@@ -85,11 +105,11 @@ if st.session_state.step == "location":
             if location.strip() == "":
                 st.warning("Please enter your location.")
             else:
-                st.session_state.data["location"] = location.strip()
+                data["location"] = location.strip()
                 next_step("tech_stack")
 
 # Step 8: Tech Stack
-if st.session_state.step == "tech_stack":
+if step == "tech_stack":
     with st.form("stack_form"):
         tech_stack = st.text_area("List the programming languages, frameworks, databases, and tools you're proficient in:")
         submitted = st.form_submit_button("Generate Questions")
@@ -97,23 +117,27 @@ if st.session_state.step == "tech_stack":
             if tech_stack.strip() == "":
                 st.warning("Please describe your tech stack.")
             else:
-                st.session_state.data["tech_stack"] = tech_stack.strip()
+                data["tech_stack"] = tech_stack.strip()
                 next_step("questions")
 
 # Step 9: Generate Technical Questions
 # Replace your Step 9 and Final Step with this:
 
 # Step 9: Generate Technical Questions
-if st.session_state.step == "questions":
+if step == "questions":
     with st.chat_message("assistant"):
         st.markdown("Generating questions based on your tech stack...")
         try:
-            questions = generate_questions(st.session_state.data["tech_stack"])
-            st.session_state.data["questions"] = questions
+            # Generate once; later reruns of this step reuse the stored questions
+            questions = data.get("questions")
+            if not questions:
+                questions = generate_questions(data["tech_stack"])
+                data["questions"] = questions
+                save_session()
             
             # Display questions with instructions
             st.markdown("### 📝 Technical Assessment Questions")
-            st.markdown(f"**Based on your tech stack: {st.session_state.data['tech_stack']}**")
+            st.markdown(f"**Based on your tech stack: {data['tech_stack']}**")
             st.markdown("---")
             st.markdown(questions)
             st.markdown("---")
@@ -143,7 +167,7 @@ if st.session_state.step == "questions":
             st.stop()
 
 # Step 10: Detailed Summary
-if st.session_state.step == "summary":
+if step == "summary":
     st.markdown("## 📋 Assessment Summary")
     
     # Candidate Details
@@ -151,23 +175,23 @@ if st.session_state.step == "summary":
     col1, col2 = st.columns(2)
     
     with col1:
-        st.write(f"**Name:** {st.session_state.data['name']}")
-        st.write(f"**Email:** {st.session_state.data['email']}")
-        st.write(f"**Phone:** {st.session_state.data['phone']}")
+        st.write(f"**Name:** {data['name']}")
+        st.write(f"**Email:** {data['email']}")
+        st.write(f"**Phone:** {data['phone']}")
     
     with col2:
-        st.write(f"**Experience:** {st.session_state.data['experience']} years")
-        st.write(f"**Position:** {st.session_state.data['position']}")
-        st.write(f"**Location:** {st.session_state.data['location']}")
+        st.write(f"**Experience:** {data['experience']} years")
+        st.write(f"**Position:** {data['position']}")
+        st.write(f"**Location:** {data['location']}")
     
     # Tech Stack
     st.markdown("### 💻 Tech Stack")
-    st.write(st.session_state.data['tech_stack'])
+    st.write(data['tech_stack'])
     
     # Questions Summary
     st.markdown("### 📝 Questions Assigned")
     with st.expander("View All Questions"):
-        st.markdown(st.session_state.data['questions'])
+        st.markdown(data['questions'])
     
     # Next Steps
     st.markdown("### 🚀 Next Steps")
@@ -182,14 +206,17 @@ if st.session_state.step == "summary":
     **Remember:** Email subject should be `Technical Assessment - [Your Name] - [Position]`
     """)
     
-    # Save data
-    save_candidate_data(st.session_state.data)
+    # Save data (once per session, not on every rerun of this step)
+    # A failed save leaves the flag unset so the next rerun retries it
+    if not state.get("saved") and save_candidate_data(data) is not None:
+        state["saved"] = True
+        save_session()
     
     if st.button("🎯 Complete Assessment", type="primary"):
         next_step("end")
 
 # Final Step: Graceful Conclusion
-if st.session_state.step == "end":
+if step == "end":
     st.markdown("---")
     st.markdown("### 🎯 Thank You!")
     
@@ -214,7 +241,9 @@ if st.session_state.step == "end":
     
     # Option to start new assessment
     if st.button("🔄 Start New Assessment"):
-        # Clear session state
+        # Clear session state and the saved application
+        store.delete(token)
+        st.query_params.clear()
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.rerun()
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""Compare intake throughput of the headless API against the Streamlit app.
+
+Both paths use the fallback question bank (no LLM calls) and write to a
+temporary candidates file. The Streamlit path is driven with
+streamlit.testing's AppTest, which executes app.py once per interaction
+just like a real session, minus the websocket.
+
+Usage:
+    python benchmarks/bench_api.py --candidates 2000 --concurrency 50
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import api  # noqa: E402
+import prompts  # noqa: E402
+import utils  # noqa: E402
+
+def profile(i):
+    return {
+        "name": f"Bench Candidate {i}",
+        "email": f"bench{i}@example.com",
+        "phone": f"{9000000000 + i}",
+        "experience": i % 15,
+        "position": "Backend Engineer",
+        "location": "Bangalore",
+        "tech_stack": "Python, Django, PostgreSQL",
+    }
+
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return status, json.loads(await reader.readexactly(length))
+
+async def run_api(candidates, concurrency, filename):
+    server = await api.start_server("127.0.0.1", 0, filename)
+    port = server.sockets[0].getsockname()[1]
+    queue = asyncio.Queue()
+    for i in range(candidates):
+        queue.put_nowait(i)
+    counts = {"requests": 0}
+
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        while not queue.empty():
+            i = queue.get_nowait()
+            status, body = await request(reader, writer, "POST", "/applications", profile(i))
+            assert status == 202, body
+            token = body["token"]
+            counts["requests"] += 1
+            while True:
+                status, body = await request(reader, writer, "GET", f"/applications/{token}?wait=5")
+                counts["requests"] += 1
+                if body["status"] == "ready":
+                    break
+            status, body = await request(reader, writer, "POST", f"/applications/{token}/finalize")
+            assert status == 200, body
+            counts["requests"] += 1
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+    return counts["requests"], elapsed
+
+def run_streamlit(candidates, filename):
+    from streamlit.testing.v1 import AppTest
+    import sessions
+
+    # Keep the benchmark's sessions out of the real session database
+    sessions.SESSION_DB_PATH = os.path.join(os.path.dirname(filename), "sessions.db")
+    original_save = utils.save_candidate_data
+    utils.save_candidate_data = lambda data, _filename=filename: original_save(data, _filename)
+    interactions = 0
+    start = time.perf_counter()
+    try:
+        for i in range(candidates):
+            data = profile(i)
+            at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=30).run()
+            interactions += 1
+            for field in ("name", "email", "phone"):
+                at.text_input[-1].input(data[field])
+                at.button[-1].click().run()
+                interactions += 1
+            at.number_input[-1].set_value(data["experience"])
+            at.button[-1].click().run()
+            interactions += 1
+            for field in ("position", "location"):
+                at.text_input[-1].input(data[field])
+                at.button[-1].click().run()
+                interactions += 1
+            at.text_area[-1].input(data["tech_stack"])
+            at.button[-1].click().run()
+            at.button[-1].click().run()  # "Proceed to Summary"
+            at.button[-1].click().run()  # "Complete Assessment"
+            interactions += 3
+            assert at.button[-1].label == "🔄 Start New Assessment", at.button[-1].label
+    finally:
+        utils.save_candidate_data = original_save
+    return interactions, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--streamlit-candidates", type=int, default=20,
+                        help="candidates driven through app.py (0 to skip)")
+    args = parser.parse_args()
+
+    prompts.generate_questions = prompts.generate_fallback_questions
+    api.generate_questions = prompts.generate_fallback_questions
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            requests_done, elapsed = asyncio.run(
+                run_api(args.candidates, args.concurrency, os.path.join(tmp, "api.json")))
+        print(f"🚀 API: {args.candidates:,} candidates, {requests_done:,} requests in {elapsed:.2f}s "
+              f"→ {requests_done / elapsed:,.0f} req/s, {args.candidates / elapsed:,.1f} candidates/s")
+
+        if args.streamlit_candidates:
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    interactions, elapsed = run_streamlit(args.streamlit_candidates,
+                                                          os.path.join(tmp, "streamlit.json"))
+            except ImportError:
+                print("⚠️ streamlit is not installed, skipping the Streamlit path")
+                return
+            print(f"🤖 Streamlit: {args.streamlit_candidates:,} candidates, {interactions:,} script runs "
+                  f"in {elapsed:.2f}s → {interactions / elapsed:,.0f} runs/s, "
+                  f"{args.streamlit_candidates / elapsed:,.1f} candidates/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark fuzzy duplicate detection with blocking keys.
+
+Usage:
+    python benchmarks/bench_dedup.py --records 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedup import DuplicateIndex, dedupe_records, _features, _match_reason  # noqa: E402
+
+FIRST_NAMES = ["Aarav", "Vivaan", "Aditya", "Vihaan", "Arjun", "Sai", "Reyansh", "Ayaan",
+               "Krishna", "Ishaan", "Ananya", "Diya", "Priya", "Saanvi", "Aadhya", "Kavya",
+               "Riya", "Meera", "Neha", "Pooja", "Rahul", "Rohan", "Karan", "Sneha"]
+LAST_NAMES = ["Sharma", "Verma", "Gupta", "Singh", "Kumar", "Patel", "Reddy", "Nair",
+              "Iyer", "Das", "Mehta", "Joshi", "Rao", "Bose", "Kapoor", "Chopra"]
+CITIES = ["Bangalore", "Mumbai", "Delhi", "Hyderabad", "Pune", "Chennai", "Kolkata",
+          "Noida", "Gurgaon", "Ahmedabad", "Jaipur", "Kochi"]
+SYLLABLES = ["ka", "ri", "san", "dev", "mo", "lu", "pra", "vin", "sh", "ta", "ne", "ho", "jal", "bir"]
+
+def make_records(count, duplicate_rate, seed=7):
+    """Generate synthetic candidates, a fraction of which are disguised repeats.
+
+    Every record carries a "person" key (ignored by dedup) as ground truth.
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        if records and rng.random() < duplicate_rate:
+            original = rng.choice(records)
+            variant = dict(original)
+            local, domain = original["email"].split("@")
+            kind = rng.randrange(4)
+            if kind == 0:
+                # Same phone, reformatted; unrelated email
+                variant["phone"] = "+91 " + original["phone"][:5] + " " + original["phone"][5:]
+                variant["email"] = f"other{i}@example.com"
+            elif kind == 1:
+                # Gmail dot/plus alias; new phone
+                variant["email"] = f"{local[:3]}.{local[3:]}+jobs@{domain}"
+                variant["phone"] = str(rng.randrange(6_000_000_000, 9_999_999_999))
+            elif kind == 2:
+                # Mistyped area code; unrelated email
+                variant["phone"] = str(rng.randrange(600, 999)) + original["phone"][-7:]
+                variant["email"] = f"other{i}@example.com"
+            else:
+                # Same handle at another provider; new phone
+                variant["email"] = f"{local}@yahoo.com"
+                variant["phone"] = str(rng.randrange(6_000_000_000, 9_999_999_999))
+            records.append(variant)
+            continue
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        middle = "".join(rng.choice(SYLLABLES) for _ in range(4)).title()
+        records.append({
+            "person": i,
+            "name": f"{first} {middle} {last}",
+            "email": f"{first.lower()}{last.lower()}{i}@gmail.com",
+            "phone": str(rng.randrange(6_000_000_000, 9_999_999_999)),
+            "location": rng.choice(CITIES),
+        })
+    return records
+
+def score(records, duplicates):
+    """Precision and recall of reported duplicates against the ground truth"""
+    seen, expected = set(), 0
+    for record in records:
+        if record["person"] in seen:
+            expected += 1
+        seen.add(record["person"])
+    correct = sum(1 for record, kept, _ in duplicates if record["person"] == kept["person"])
+    precision = correct / len(duplicates) if duplicates else 1.0
+    recall = correct / expected if expected else 1.0
+    return precision, recall, len(duplicates) - correct, expected
+
+def naive_dedupe(records):
+    """Pairwise comparison baseline (O(n^2))"""
+    unique, features, duplicates = [], [], 0
+    for record in records:
+        f = _features(record)
+        if any(f[0] == g[0] or f[1] == g[1] or _match_reason(f, g) for g in features):
+            duplicates += 1
+        else:
+            unique.append(record)
+            features.append(f)
+    return unique, duplicates
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--duplicate-rate", type=float, default=0.05)
+    parser.add_argument("--naive-records", type=int, default=2_000,
+                        help="size of the pairwise baseline run (it is quadratic)")
+    args = parser.parse_args()
+
+    records = make_records(args.records, args.duplicate_rate)
+    print(f"📊 {len(records):,} records, ~{args.duplicate_rate:.0%} disguised duplicates")
+
+    (unique, duplicates), elapsed = timed(dedupe_records, records)
+    print(f"✅ Batch dedupe: {len(duplicates):,} duplicates in {elapsed:.2f}s "
+          f"({len(records) / elapsed:,.0f} records/s)")
+    precision, recall, false_positives, expected = score(records, duplicates)
+    print(f"🎯 Precision {precision:.2%} ({false_positives:,} distinct people merged), "
+          f"recall {recall:.2%} of {expected:,} injected repeats")
+
+    index, elapsed = timed(DuplicateIndex, unique)
+    print(f"✅ Index build over {len(unique):,} unique records: {elapsed:.2f}s")
+
+    probes = make_records(1_000, 0.5, seed=11)
+    start = time.perf_counter()
+    for probe in probes:
+        index.find(probe)
+    per_lookup = (time.perf_counter() - start) / len(probes)
+    print(f"✅ Save-time lookup: {per_lookup * 1e6:.0f}µs per candidate")
+
+    sample = records[:args.naive_records]
+    (_, naive_count), naive_elapsed = timed(naive_dedupe, sample)
+    (_, blocked), blocked_elapsed = timed(dedupe_records, sample)
+    print(f"🔍 Pairwise baseline on {len(sample):,} records: {naive_elapsed:.2f}s "
+          f"({naive_count} duplicates) vs blocked {blocked_elapsed:.3f}s ({len(blocked)} duplicates)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark the skill index and BM25 candidate ranking.
+
+Usage:
+    python benchmarks/bench_search.py --records 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search import SkillIndex  # noqa: E402
+
+TECHNOLOGIES = ["Python", "Django", "Flask", "FastAPI", "Java", "Spring Boot", "Kotlin", "Go",
+                "Golang", "Rust", "C++", "C#", ".NET", "JavaScript", "TypeScript", "React",
+                "Node.js", "Vue.js", "Angular", "SQL", "PostgreSQL", "MySQL", "MongoDB", "Redis",
+                "Kafka", "RabbitMQ", "Docker", "Kubernetes", "AWS", "GCP", "Azure", "Terraform",
+                "Spark", "Hadoop", "Airflow", "TensorFlow", "PyTorch", "Pandas", "GraphQL", "gRPC"]
+
+JOB_DESCRIPTION = """We are looking for a backend engineer with strong Go and Kafka experience,
+comfortable with Kubernetes, PostgreSQL and gRPC on AWS. Python is a plus."""
+
+def make_records(count, seed=7):
+    rng = random.Random(seed)
+    return [{
+        "name": f"Candidate {i}",
+        "experience": rng.randrange(0, 16),
+        "tech_stack": ", ".join(rng.sample(TECHNOLOGIES, rng.randrange(3, 10))),
+    } for i in range(count)]
+
+def best_of(fn, repeat=20):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    print(f"📊 {len(records):,} candidates")
+
+    start = time.perf_counter()
+    index = SkillIndex(records)
+    print(f"✅ Index build: {time.perf_counter() - start:.2f}s")
+
+    extra = make_records(1_000, seed=11)
+    start = time.perf_counter()
+    for record in extra:
+        index.add(record)
+    print(f"✅ Incremental add: {(time.perf_counter() - start) / len(extra) * 1e6:.0f}µs per candidate")
+
+    queries = {
+        "Kafka AND Go, 5+ years": lambda: index.search(required=["Kafka", "Go"], min_experience=5),
+        "Job description ranking": lambda: index.search(JOB_DESCRIPTION),
+        "Job description + Kafka, 5+ years": lambda: index.search(JOB_DESCRIPTION, ["Kafka"], 5),
+    }
+    index.search(JOB_DESCRIPTION)  # warm the lazily built arrays
+    for label, query in queries.items():
+        results, elapsed = best_of(query)
+        print(f"🔎 {label}: {elapsed * 1000:.1f} ms ({len(results)} results)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Track worker cold-start and per-interaction cost of the Streamlit app.
+
+Cold start: wall time to import the app's modules in a fresh interpreter
+(what a new Streamlit worker pays before the first script run).
+Per interaction: CPU time of each app.py rerun through a full intake flow,
+driven with streamlit.testing's AppTest and the fallback question bank.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 10
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+COLD_START = """
+import time
+start = time.perf_counter()
+import prompts, utils, sessions
+elapsed = time.perf_counter() - start
+import sys
+print(elapsed, len(sys.modules))
+"""
+
+VALIDATION_CALLS = 100_000
+
+def cold_start(runs):
+    timings, modules = [], 0
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", COLD_START], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout.split()
+        timings.append(float(output[0]))
+        modules = int(output[1])
+    return timings, modules
+
+def interaction_costs(runs):
+    import prompts
+    import sessions
+    import utils
+    from streamlit.testing.v1 import AppTest
+
+    prompts.generate_questions = prompts.generate_fallback_questions
+    original_save = utils.save_candidate_data
+    costs = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "candidates.json")
+        # Keep the benchmark's sessions out of the real session database
+        sessions.SESSION_DB_PATH = os.path.join(tmp, "sessions.db")
+        utils.save_candidate_data = lambda data, _filename=filename: original_save(data, _filename)
+        try:
+            for i in range(runs):
+                at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=30)
+
+                def run(action=None):
+                    start = time.process_time()
+                    (action() if action else at).run()
+                    costs.append(time.process_time() - start)
+
+                run()
+                for value in (f"Startup Bench {'abcdefghij'[i % 10]}", f"startup{i}@example.com",
+                              f"{8000000000 + i}"):
+                    at.text_input[-1].input(value)
+                    run(at.button[-1].click)
+                at.number_input[-1].set_value(3)
+                run(at.button[-1].click)
+                for value in ("Engineer", "Pune"):
+                    at.text_input[-1].input(value)
+                    run(at.button[-1].click)
+                at.text_area[-1].input("Python, SQL")
+                run(at.button[-1].click)
+                run(at.button[-1].click)  # "Proceed to Summary"
+                run(at.button[-1].click)  # "Complete Assessment"
+        finally:
+            utils.save_candidate_data = original_save
+    return costs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    timings, modules = cold_start(args.runs)
+    print(f"🧊 Cold import of prompts/utils/sessions: median {statistics.median(timings) * 1000:.0f} ms, "
+          f"min {min(timings) * 1000:.0f} ms ({modules} modules loaded)")
+
+    from utils import validate_email
+    start = time.perf_counter()
+    for _ in range(VALIDATION_CALLS):
+        validate_email("candidate@example.com")
+    print(f"✅ validate_email: {(time.perf_counter() - start) / VALIDATION_CALLS * 1e9:.0f} ns per call")
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            costs = interaction_costs(args.runs)
+    except ImportError:
+        print("⚠️ streamlit is not installed, skipping per-interaction cost")
+        return
+    print(f"🔁 app.py rerun CPU: median {statistics.median(costs) * 1000:.1f} ms, "
+          f"max {max(costs) * 1000:.1f} ms over {len(costs)} interactions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+# Canonical phone numbers keep the last 10 digits (drops +91 / 0 prefixes)
+PHONE_DIGITS = 10
+# Digits used for the fuzzy phone blocking key
+PHONE_SUFFIX_DIGITS = 7
+# Minimum name similarity for a fuzzy match inside a block
+NAME_SIMILARITY = 0.88
+# Minimum similarity of email local parts to count as a second signal
+EMAIL_SIMILARITY = 0.85
+# Only the most recent members of a block are compared, so a very common
+# name + city bucket can never turn a lookup back into a full scan
+MAX_BLOCK_COMPARISONS = 200
+
+GMAIL_DOMAINS = {"gmail.com", "googlemail.com"}
+
+_NON_DIGIT_RE = re.compile(r"\D")
+_DIGIT_RE = re.compile(r"\d")
+_NON_ALPHA_RE = re.compile(r"[^a-z ]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_SOUNDEX_CODES = {}
+for _letters, _code in (("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"),
+                        ("l", "4"), ("mn", "5"), ("r", "6")):
+    for _letter in _letters:
+        _SOUNDEX_CODES[_letter] = _code
+
+def normalize_phone(phone: Any) -> str:
+    """Return the canonical phone number: digits only, last 10 digits"""
+    digits = _NON_DIGIT_RE.sub("", str(phone or ""))
+    return digits[-PHONE_DIGITS:]
+
+def normalize_email(email: Any) -> str:
+    """Return the canonical email, folding Gmail dot and plus aliases"""
+    email = str(email or "").strip().lower()
+    if "@" not in email:
+        return email
+    local, _, domain = email.rpartition("@")
+    if domain in GMAIL_DOMAINS:
+        local = local.split("+", 1)[0].replace(".", "")
+        domain = "gmail.com"
+    return f"{local}@{domain}"
+
+def normalize_name(name: Any) -> str:
+    """Lowercase the name and strip everything except letters and single spaces"""
+    name = _NON_ALPHA_RE.sub(" ", str(name or "").lower())
+    return _WHITESPACE_RE.sub(" ", name).strip()
+
+def normalize_location(location: Any) -> str:
+    """Normalize a location for blocking (city part only, lowercase)"""
+    city = str(location or "").split(",", 1)[0]
+    return normalize_name(city)
+
+def soundex(word: str) -> str:
+    """Classic 4-character American Soundex code"""
+    word = "".join(ch for ch in word.lower() if ch.isalpha())
+    if not word:
+        return ""
+    code = word[0].upper()
+    previous = _SOUNDEX_CODES.get(word[0], "")
+    for ch in word[1:]:
+        digit = _SOUNDEX_CODES.get(ch, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if ch not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+def _features(record: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    return (
+        normalize_email(record.get("email")),
+        normalize_phone(record.get("phone")),
+        normalize_name(record.get("name")),
+        normalize_location(record.get("location")),
+    )
+
+def _blocking_keys(features: Tuple[str, str, str, str]) -> List[str]:
+    """Keys of the small buckets a record is compared against"""
+    _, phone, name, location = features
+    keys = []
+    if len(phone) >= PHONE_SUFFIX_DIGITS:
+        keys.append("ps:" + phone[-PHONE_SUFFIX_DIGITS:])
+    if name and location:
+        parts = name.split()
+        keys.append(f"nl:{soundex(parts[0])}{soundex(parts[-1])}:{location}")
+    return keys
+
+def _similar(a: str, b: str, threshold: float) -> bool:
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    # Cheap upper bounds first; the full ratio() is the expensive part
+    if 2 * min(len(a), len(b)) < threshold * (len(a) + len(b)):
+        return False
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    return (matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold)
+
+def _emails_similar(a: str, b: str) -> bool:
+    """Whether two canonical emails look like the same person's addresses"""
+    a_local, b_local = a.partition("@")[0], b.partition("@")[0]
+    # Numbered addresses (rahul12 vs rahul13) usually belong to different people
+    a_digits, b_digits = _DIGIT_RE.findall(a_local), _DIGIT_RE.findall(b_local)
+    if a_digits and b_digits and a_digits != b_digits:
+        return False
+    return _similar(a_local, b_local, EMAIL_SIMILARITY)
+
+def _match_reason(new: Tuple[str, str, str, str], existing: Tuple[str, str, str, str]) -> Optional[str]:
+    """Return why two records are considered the same candidate, or None.
+
+    A similar name is never enough on its own: it must be backed by the
+    same phone suffix, or by a similar email in the same location.
+    """
+    new_email, new_phone, new_name, new_location = new
+    old_email, old_phone, old_name, old_location = existing
+
+    if not _similar(new_name, old_name, NAME_SIMILARITY):
+        return None
+    if (len(new_phone) >= PHONE_SUFFIX_DIGITS
+            and new_phone[-PHONE_SUFFIX_DIGITS:] == old_phone[-PHONE_SUFFIX_DIGITS:]):
+        return "name+phone"
+    if new_location and new_location == old_location and _emails_similar(new_email, old_email):
+        return "name+email"
+    return None
+
+class DuplicateIndex:
+    """Blocking-key index for fuzzy duplicate detection.
+
+    Canonical emails and phones are exact hash lookups; fuzzy name
+    comparisons only run inside the phone-suffix and name-soundex+location
+    buckets, so a lookup costs O(bucket size) instead of O(n).
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        self._records: List[Dict[str, Any]] = []
+        self._features: List[Tuple[str, str, str, str]] = []
+        self._emails: Dict[str, int] = {}
+        self._phones: Dict[str, int] = {}
+        self._blocks: Dict[str, List[int]] = defaultdict(list)
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        return self._records
+
+    def find(self, record: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return (existing record, reason) if record duplicates an indexed one"""
+        return self._find(_features(record))
+
+    def _find(self, features: Tuple[str, str, str, str]) -> Optional[Tuple[Dict[str, Any], str]]:
+        email, phone = features[0], features[1]
+
+        if email and email in self._emails:
+            return self._records[self._emails[email]], "email"
+        if phone and phone in self._phones:
+            return self._records[self._phones[phone]], "phone"
+
+        for key in _blocking_keys(features):
+            members = self._blocks.get(key)
+            if not members:
+                continue
+            for position in reversed(members[-MAX_BLOCK_COMPARISONS:]):
+                reason = _match_reason(features, self._features[position])
+                if reason:
+                    return self._records[position], reason
+        return None
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Index a record (does not check for duplicates)"""
+        self._add(record, _features(record))
+
+    def _add(self, record: Dict[str, Any], features: Tuple[str, str, str, str]) -> None:
+        position = len(self._records)
+        self._records.append(record)
+        self._features.append(features)
+
+        email, phone = features[0], features[1]
+        if email:
+            self._emails.setdefault(email, position)
+        if phone:
+            self._phones.setdefault(phone, position)
+        for key in _blocking_keys(features):
+            self._blocks[key].append(position)
+
+    def add_if_new(self, record: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Index record unless it is a duplicate; return the match if it is"""
+        features = _features(record)
+        match = self._find(features)
+        if match is None:
+            self._add(record, features)
+        return match
+
+def dedupe_records(records: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], Dict[str, Any], str]]]:
+    """Split records into (unique, duplicates), keeping the first occurrence.
+
+    Each duplicate is reported as (record, kept record, reason).
+    """
+    index = DuplicateIndex()
+    duplicates = []
+    for record in records:
+        match = index.add_if_new(record)
+        if match is not None:
+            duplicates.append((record, match[0], match[1]))
+    return index.records, duplicates
@@ -75,26 +75,34 @@
 #         return f"Request error: {req_err}"
 #     except Exception as e:
 #         return f"⚠️ An unexpected error occurred: {str(e)}"
-from dotenv import load_dotenv
 import os
-import requests
-
-# Load environment variables
-load_dotenv()
-hf_token = os.getenv("HUGGINGFACEHUB_API_TOKEN")
+from functools import lru_cache
 
 # Use a hosted instruction-tuned model
 MODEL_ID = "HuggingFaceH4/zephyr-7b-beta"
 
 API_URL = f"https://api-inference.huggingface.co/models/{MODEL_ID}"
 
-HEADERS = {
-    "Authorization": f"Bearer {hf_token}",
-    "Content-Type": "application/json"
-}
+GREETING = "👋 Hello! I'm TalentScout, your intelligent hiring assistant. I'll ask you a few questions to get started."
+
+@lru_cache(maxsize=None)
+def get_headers():
+    """Load the API token and build request headers on first use.
+
+    Keeps python-dotenv and the .env read off the import path, which every
+    Streamlit worker pays at cold start.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    hf_token = os.getenv("HUGGINGFACEHUB_API_TOKEN")
+    return {
+        "Authorization": f"Bearer {hf_token}",
+        "Content-Type": "application/json"
+    }
 
 def generate_greeting():
-    return "👋 Hello! I'm TalentScout, your intelligent hiring assistant. I'll ask you a few questions to get started."
+    return GREETING
 
 def generate_fallback_questions(tech_stack):
     """Generate fallback questions when API fails"""
@@ -205,7 +213,10 @@ def generate_questions(tech_stack):
             }
         }
 
-        response = requests.post(API_URL, headers=HEADERS, json=payload, timeout=90)
+        # requests is only needed once questions are generated, not at import
+        import requests
+
+        response = requests.post(API_URL, headers=get_headers(), json=payload, timeout=90)
         
         # If API call succeeds, process the response
         if response.status_code == 200:
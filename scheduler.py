@@ -0,0 +1,143 @@
+"""Deadline scheduler for candidate status transitions.
+
+Moves candidates from "questions_sent" to "reminder_due" shortly before
+their submission deadline and to "expired" once it passes. Pending
+transitions are kept in a min-heap loaded from the deadline index
+(data/candidates.deadlines.jsonl), so the scheduler sleeps until the next
+due entry instead of rescanning the candidates file.
+
+Run with:
+    python scheduler.py
+"""
+import argparse
+import heapq
+import json
+import os
+import threading
+import time
+from typing import Optional, Dict, List
+
+from utils import (deadline_index_path, rebuild_deadline_index, prune_deadline_index,
+                   update_candidate_statuses)
+
+def _parse_entry(line: bytes) -> list:
+    due, candidate_id, status = json.loads(line)
+    return [float(due), candidate_id, status]
+
+class DeadlineScheduler:
+    """Min-heap of (due timestamp, candidate_id, status) entries"""
+
+    def __init__(self, filename: str = "data/candidates.json",
+                 batch_window: float = 60.0, max_sleep: float = 300.0):
+        self.filename = filename
+        self.index_filename = deadline_index_path(filename)
+        # Wait this long past the first due entry so neighbours share one write
+        self.batch_window = batch_window
+        # Upper bound on sleeping, to pick up entries appended by other processes
+        self.max_sleep = max_sleep
+        self._heap: List[list] = []
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def load(self) -> int:
+        """Build the queue from the deadline index; returns the number of entries"""
+        if not os.path.exists(self.index_filename):
+            print("⚠️ No deadline index found, rebuilding from candidates file")
+            rebuild_deadline_index(self.filename)
+        self._heap = []
+        self._offset = 0
+        self._read_new_entries()
+        return len(self._heap)
+
+    def _read_new_entries(self) -> None:
+        """Push entries appended to the index since the last read"""
+        try:
+            with open(self.index_filename, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+
+        # Leave a partially written last line for the next read
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if line.strip():
+                heapq.heappush(self._heap, _parse_entry(line))
+        self._offset += end
+
+    def next_due(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """Apply every transition due by `now` in one write; returns candidates changed"""
+        now = time.time() if now is None else now
+        self._read_new_entries()
+        if not self._heap or self._heap[0][0] > now:
+            return 0
+
+        due: List[list] = []
+        updates: Dict[str, str] = {}
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            due.append(entry)
+            _, candidate_id, status = entry
+            # "expired" wins over a reminder that fell due in the same batch
+            if updates.get(candidate_id) != "expired":
+                updates[candidate_id] = status
+
+        try:
+            changed = update_candidate_statuses(updates, self.filename)
+        except Exception:
+            # Nothing was applied; keep the entries queued and in the index for a retry
+            for entry in due:
+                heapq.heappush(self._heap, entry)
+            raise
+
+        # Drop applied entries from the index so a restart does not reload them
+        self._heap, self._offset = prune_deadline_index(self.filename, now)
+        heapq.heapify(self._heap)
+
+        print(f"✅ Applied {changed} status transitions ({len(updates)} due)")
+        return changed
+
+    def run_forever(self, stop_event: Optional[threading.Event] = None) -> None:
+        stop_event = stop_event or threading.Event()
+        pending = self.load()
+        print(f"⏰ Deadline scheduler started with {pending} pending transitions")
+
+        while not stop_event.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                print(f"❌ Error applying status transitions: {str(e)}")
+                stop_event.wait(self.batch_window)
+                continue
+
+            due = self.next_due()
+            timeout = self.max_sleep
+            if due is not None:
+                timeout = min(max(due + self.batch_window - time.time(), 0), self.max_sleep)
+            stop_event.wait(timeout)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TalentScout deadline scheduler")
+    parser.add_argument("--data", default="data/candidates.json", help="candidates JSON file")
+    parser.add_argument("--once", action="store_true", help="apply due transitions and exit")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="rebuild the deadline index from a full scan first")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        print(f"✅ Rebuilt deadline index with {rebuild_deadline_index(args.data)} entries")
+
+    scheduler = DeadlineScheduler(args.data)
+    if args.once:
+        scheduler.load()
+        scheduler.run_pending()
+    else:
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            pass
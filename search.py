@@ -0,0 +1,191 @@
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+import numpy as np
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Spellings folded onto one canonical technology token
+TECH_ALIASES = {
+    "golang": "go",
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "node": "nodejs",
+    "node.js": "nodejs",
+    "react.js": "react",
+    "reactjs": "react",
+    "vue.js": "vue",
+    "vuejs": "vue",
+    "next.js": "nextjs",
+    "express.js": "express",
+    "expressjs": "express",
+    "angularjs": "angular",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "py": "python",
+    "python3": "python",
+    "csharp": "c#",
+    "dotnet": ".net",
+    "asp.net": ".net",
+    "springboot": "spring",
+    "sklearn": "scikit-learn",
+    "tf": "tensorflow",
+    "amazon": "aws",
+    "gcp": "google-cloud",
+    "apache": "",
+}
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "have", "i",
+    "in", "is", "it", "of", "on", "or", "our", "the", "to", "we", "with", "you",
+    "your", "will", "years", "year", "experience", "knowledge", "good", "strong",
+    "basic", "skills", "proficient", "familiar", "working", "etc", "also", "using",
+    "work", "team", "role", "looking", "candidate", "must", "should", "plus",
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*|\.net")
+
+def tokenize(text: Any) -> List[str]:
+    """Split free text into normalized technology tokens"""
+    tokens = []
+    for raw in _TOKEN_RE.findall(str(text or "").lower()):
+        raw = raw.rstrip(".-")
+        token = TECH_ALIASES.get(raw, raw)
+        # Skip numbers and quantities such as "5+" from "5+ years"
+        if token and token not in STOPWORDS and not token[0].isdigit():
+            tokens.append(token)
+    return tokens
+
+def _experience(record: Dict[str, Any]) -> float:
+    try:
+        return float(record.get("experience", 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+class SkillIndex:
+    """Inverted index from technology tokens to candidate positions with BM25 ranking.
+
+    Records are identified by their position in the candidates list (not
+    their candidate_id field), so the index is extended incrementally as
+    records are appended. Postings are kept as Python lists for cheap
+    appends and converted to NumPy arrays lazily for scoring.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._frequencies: Dict[str, List[int]] = defaultdict(list)
+        self._lengths: List[int] = []
+        self._experience: List[float] = []
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._doc_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, record: Dict[str, Any]) -> int:
+        """Index a candidate record and return its position"""
+        position = len(self._lengths)
+        counts = Counter(tokenize(record.get("tech_stack", "")))
+
+        for token, count in counts.items():
+            self._postings[token].append(position)
+            self._frequencies[token].append(count)
+            self._arrays.pop(token, None)
+
+        self._lengths.append(sum(counts.values()))
+        self._experience.append(_experience(record))
+        self._doc_arrays = None
+        return position
+
+    def sync(self, records: List[Dict[str, Any]]) -> "SkillIndex":
+        """Index records appended since the last sync; rebuild if the list shrank"""
+        if len(records) < len(self):
+            self.__init__(records)
+        else:
+            for record in records[len(self):]:
+                self.add(record)
+        return self
+
+    def candidates_with(self, skills: Iterable[str]) -> List[int]:
+        """Positions of candidates listing every one of the given skills.
+
+        Skills that normalize to nothing ("Apache", "experience") are
+        ignored, so they never hide every candidate.
+        """
+        tokens = set(tokenize(" ".join(skills)))
+        if not tokens:
+            return list(range(len(self)))
+        positions = None
+        for token in sorted(tokens, key=lambda t: len(self._postings.get(t, ()))):
+            posting = self._posting_arrays(token)[0]
+            positions = posting if positions is None else np.intersect1d(positions, posting, assume_unique=True)
+            if len(positions) == 0:
+                break
+        return positions.tolist()
+
+    def search(self, job_description: str = "", required: Iterable[str] = (),
+               min_experience: float = 0, limit: int = 20) -> List[Tuple[int, float]]:
+        """Rank candidates against a job description.
+
+        Candidates must list every required skill and have at least
+        min_experience years; the rest are ordered by BM25 score over the
+        job description and required skills. Returns (position, score).
+        """
+        total = len(self)
+        if total == 0:
+            return []
+
+        required_tokens = tokenize(" ".join(required))
+        query = Counter(tokenize(job_description) + required_tokens)
+        lengths, experience = self._document_arrays()
+
+        valid = experience >= min_experience
+        if required_tokens:
+            allowed = np.zeros(total, dtype=bool)
+            allowed[self.candidates_with(required_tokens)] = True
+            valid &= allowed
+
+        if query:
+            scores = np.zeros(total, dtype=np.float64)
+            average_length = max(lengths.mean(), 1.0)
+            for token in query:
+                if token not in self._postings:
+                    continue
+                positions, frequencies = self._posting_arrays(token)
+                df = len(positions)
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[positions] / average_length)
+                scores[positions] += idf * frequencies * (BM25_K1 + 1) / (frequencies + norm)
+            valid &= scores > 0
+        else:
+            scores = experience.astype(np.float64)
+
+        matches = np.flatnonzero(valid)
+        if len(matches) > limit:
+            top = np.argpartition(-scores[matches], limit - 1)[:limit]
+            matches = matches[top]
+        order = matches[np.argsort(-scores[matches], kind="stable")]
+        return [(int(i), float(scores[i])) for i in order]
+
+    def _posting_arrays(self, token: str) -> Tuple[np.ndarray, np.ndarray]:
+        arrays = self._arrays.get(token)
+        if arrays is None:
+            arrays = (np.asarray(self._postings.get(token, ()), dtype=np.int64),
+                      np.asarray(self._frequencies.get(token, ()), dtype=np.float64))
+            self._arrays[token] = arrays
+        return arrays
+
+    def _document_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._doc_arrays is None:
+            self._doc_arrays = (np.asarray(self._lengths, dtype=np.float64),
+                                np.asarray(self._experience, dtype=np.float64))
+        return self._doc_arrays
@@ -0,0 +1,106 @@
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
+
+# Default location of the session database
+SESSION_DB_PATH = "data/sessions.db"
+# Idle sessions older than this are evicted
+SESSION_TTL = 24 * 60 * 60
+# Least recently used sessions beyond this count are evicted
+MAX_SESSIONS = 10_000
+# Run eviction once every this many new sessions
+EVICT_EVERY = 100
+
+class SessionStore:
+    """SQLite-backed store for in-progress applications.
+
+    Each session is a (step, data) pair keyed by a resumable token, so any
+    worker can pick up a candidate where they left off. Idle sessions are
+    evicted by TTL and, past MAX_SESSIONS, least recently used first.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = SESSION_TTL,
+                 max_sessions: int = MAX_SESSIONS):
+        path = path or SESSION_DB_PATH
+        self.path = path
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._created = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # One connection shared by every script thread (Streamlit starts a new
+        # thread per rerun), so reruns skip the connect and PRAGMA setup
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " token TEXT PRIMARY KEY,"
+                " step TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " updated REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated)")
+
+    def create(self, step: str = "greet", data: Optional[Dict[str, Any]] = None) -> str:
+        """Start a new session and return its token"""
+        token = secrets.token_urlsafe(16)
+        self.save(token, step, data or {})
+
+        self._created += 1
+        if self._created % EVICT_EVERY == 0:
+            self.evict()
+        return token
+
+    def load(self, token: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return (step, data) for a live session, or None if unknown or expired"""
+        with self._lock, self._db as db:
+            row = db.execute(
+                "SELECT step, data, updated FROM sessions WHERE token = ?", (token,)
+            ).fetchone()
+            if row is None:
+                return None
+            step, data, updated = row
+            now = time.time()
+            if updated < now - self.ttl:
+                db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+                return None
+            db.execute("UPDATE sessions SET updated = ? WHERE token = ?", (now, token))
+        return step, json.loads(data)
+
+    def save(self, token: str, step: str, data: Dict[str, Any]) -> None:
+        with self._lock, self._db as db:
+            db.execute(
+                "INSERT OR REPLACE INTO sessions (token, step, data, updated) VALUES (?, ?, ?, ?)",
+                (token, step, json.dumps(data, ensure_ascii=False, separators=(",", ":")), time.time()),
+            )
+
+    def delete(self, token: str) -> None:
+        with self._lock, self._db as db:
+            db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+
+    def evict(self) -> int:
+        """Remove expired sessions and trim to max_sessions; returns sessions removed"""
+        with self._lock, self._db as db:
+            removed = db.execute(
+                "DELETE FROM sessions WHERE updated < ?", (time.time() - self.ttl,)
+            ).rowcount
+            excess = db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] - self.max_sessions
+            if excess > 0:
+                removed += db.execute(
+                    "DELETE FROM sessions WHERE token IN"
+                    " (SELECT token FROM sessions ORDER BY updated LIMIT ?)", (excess,)
+                ).rowcount
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
@@ -0,0 +1,203 @@
+"""Tests for the change feed, duplicate matching and deadline scheduler.
+
+Run with:
+    python -m pytest tests
+"""
+import json
+import time
+
+import pytest
+
+import utils
+from dedup import DuplicateIndex, _emails_similar
+from scheduler import DeadlineScheduler
+
+NAMES = ["Asha Rao", "Vikram Mehta", "Neha Kapoor", "Arjun Nair", "Priya Iyer",
+         "Karan Malhotra", "Divya Menon", "Rohan Gupta", "Sneha Kulkarni", "Manish Verma"]
+
+def profile(i, **fields):
+    record = {
+        "name": NAMES[i],
+        "email": f"{NAMES[i].split()[0].lower()}.{NAMES[i].split()[1].lower()}@example.com",
+        "phone": f"98{i}{i}{i}{i}{i}{i}{i}{i}",
+        "experience": i,
+        "position": "Backend Engineer",
+        "location": "Pune",
+        "tech_stack": "Python, Django",
+    }
+    record.update(fields)
+    return record
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "candidates.json")
+
+def add_duplicate(filename):
+    """Append a copy of the first record behind save_candidate's back"""
+    candidates = utils.load_candidate_data(filename)
+    candidates.append(dict(candidates[0], candidate_id="copy"))
+    utils._write_candidates(filename, candidates)
+
+# Change feed
+
+def test_reset_while_reader_is_mid_log(filename):
+    for i in range(3):
+        assert utils.save_candidate(profile(i), filename) == utils.SAVE_SAVED
+    feed = utils.CandidateFeed(filename)
+    feed.refresh()
+    reader_sequence = feed.sequence
+
+    add_duplicate(filename)
+    assert utils.remove_duplicates_from_file(filename) == 1
+    # The log is truncated to one reset line, but sequence numbers keep growing
+    with open(utils.changes_log_path(filename)) as f:
+        assert [json.loads(line)["op"] for line in f] == ["reset"]
+    assert utils.get_change_sequence(filename) > reader_sequence
+
+    # Grow the new log past the reader's old offset before it polls again
+    for i in range(3, 10):
+        utils.save_candidate(profile(i), filename)
+    changes, sequence = utils.get_changes(reader_sequence, filename)
+    assert [c["op"] for c in changes] == ["reset"] + ["insert"] * 7
+    assert sequence == utils.get_change_sequence(filename)
+
+    feed.refresh()
+    assert [c["candidate_id"] for c in feed.candidates] == \
+        [c["candidate_id"] for c in utils.load_candidate_data(filename)]
+
+def test_consecutive_resets_are_both_seen(filename):
+    utils.save_candidate(profile(0), filename)
+    add_duplicate(filename)
+    utils.remove_duplicates_from_file(filename)
+    after_first = utils.get_change_sequence(filename)
+
+    add_duplicate(filename)
+    utils.remove_duplicates_from_file(filename)
+    changes, sequence = utils.get_changes(after_first, filename)
+    assert [c["op"] for c in changes] == ["reset"]
+    assert sequence == utils.get_change_sequence(filename)
+
+def test_partial_line_is_read_once_complete(filename):
+    utils.save_candidate(profile(0), filename)
+    start = utils.get_change_sequence(filename)
+    line = json.dumps({"op": "update", "candidate_id": "x", "fields": {"status": "expired"}}) + "\n"
+
+    with open(utils.changes_log_path(filename), "a") as f:
+        f.write(line[:10])
+    assert utils.get_changes(start, filename) == ([], start)
+
+    with open(utils.changes_log_path(filename), "a") as f:
+        f.write(line[10:])
+    changes, sequence = utils.get_changes(start, filename)
+    assert [c["candidate_id"] for c in changes] == ["x"]
+    assert sequence == start + len(line)
+
+def test_insert_replayed_after_reload_is_merged(filename):
+    utils.save_candidate(profile(0), filename)
+    feed = utils.CandidateFeed(filename)
+    feed.refresh()
+    before = feed.sequence
+
+    utils.save_candidate(profile(1), filename)
+    # A reload that already saw the insert, with a sequence taken before it
+    feed._reload()
+    feed.sequence = before
+    assert feed.refresh() == 1
+    assert [c["name"] for c in feed.candidates] == [NAMES[0], NAMES[1]]
+
+def test_update_changes_merge_by_candidate_id(filename):
+    for i in range(2):
+        utils.save_candidate(profile(i), filename)
+    feed = utils.CandidateFeed(filename)
+    feed.refresh()
+
+    second = feed.candidates[1]["candidate_id"]
+    assert utils.update_candidate_statuses({second: "expired", "unknown": "expired"}, filename) == 1
+    feed.refresh()
+    assert [c["status"] for c in feed.candidates] == ["questions_sent", "expired"]
+
+# Duplicate matching
+
+@pytest.mark.parametrize("changes, reason", [
+    ({"name": "Someone Else", "email": "ASHA.RAO@example.com", "phone": "9111111111"}, "email"),
+    ({"name": "Someone Else", "email": "other@example.com", "phone": "+91 98 0000 0000"}, "phone"),
+    ({"name": "Asha  Rao.", "email": "other@example.com", "phone": "9120000000"}, "name+phone"),
+    ({"name": "Asha Raao", "email": "asha.rao@example.org", "phone": "9111111111"}, "name+email"),
+])
+def test_match_reasons(changes, reason):
+    index = DuplicateIndex([profile(0)])
+    match = index.find(profile(0, **changes))
+    assert match is not None and match[1] == reason
+
+@pytest.mark.parametrize("changes", [
+    # Same name and city only
+    {"email": "someone@example.org", "phone": "9111111111"},
+    # Similar email, but in another city
+    {"email": "asha.rao@example.org", "phone": "9111111111", "location": "Delhi"},
+    # Phone suffix matches, but the name does not
+    {"name": "Vikram Mehta", "email": "other@example.com", "phone": "9120000000"},
+])
+def test_name_needs_a_second_signal(changes):
+    assert DuplicateIndex([profile(0)]).find(profile(0, **changes)) is None
+
+def test_numbered_emails_are_different_people():
+    assert not _emails_similar("rahul12@example.com", "rahul13@example.com")
+    assert _emails_similar("rahul12@example.com", "rahul.12@example.com")
+    index = DuplicateIndex([profile(0, name="Rahul Sharma", email="rahul12@example.com")])
+    assert index.find(profile(0, name="Rahul Sharma", email="rahul13@example.com",
+                              phone="9111111111")) is None
+
+# Deadline scheduler
+
+def saved_scheduler(filename, count=2):
+    for i in range(count):
+        utils.save_candidate(profile(i), filename)
+    scheduler = DeadlineScheduler(filename)
+    assert scheduler.load() == 2 * count
+    return scheduler
+
+def statuses(filename):
+    return [c["status"] for c in utils.load_candidate_data(filename)]
+
+def test_reminder_then_expiry(filename):
+    scheduler = saved_scheduler(filename)
+    assert scheduler.run_pending(time.time() + 47 * 3600) == 2
+    assert statuses(filename) == ["reminder_due", "reminder_due"]
+    assert scheduler.run_pending(time.time() + 49 * 3600) == 2
+    assert statuses(filename) == ["expired", "expired"]
+    assert len(scheduler) == 0
+    assert DeadlineScheduler(filename).load() == 0
+
+def test_expired_wins_over_reminder_in_one_batch(filename):
+    scheduler = saved_scheduler(filename)
+    assert scheduler.run_pending(time.time() + 49 * 3600) == 2
+    assert statuses(filename) == ["expired", "expired"]
+
+def test_expired_wins_when_popped_before_reminder(filename):
+    utils.save_candidate(profile(0), filename)
+    candidate_id = utils.load_candidate_data(filename)[0]["candidate_id"]
+    # Equal due times pop "expired" first, so the later reminder must not replace it
+    due = time.time()
+    utils._write_deadline_index(filename, [[due, candidate_id, "expired"],
+                                           [due, candidate_id, "reminder_due"]])
+    scheduler = DeadlineScheduler(filename)
+    scheduler.load()
+    assert scheduler.run_pending(due) == 1
+    assert statuses(filename) == ["expired"]
+
+def test_unreadable_file_keeps_due_entries(filename):
+    scheduler = saved_scheduler(filename)
+    with open(filename) as f:
+        content = f.read()
+    with open(filename, "w") as f:
+        f.write("{corrupt")
+
+    with pytest.raises(ValueError):
+        scheduler.run_pending(time.time() + 49 * 3600)
+    assert len(scheduler) == 4
+    assert DeadlineScheduler(filename).load() == 4
+
+    with open(filename, "w") as f:
+        f.write(content)
+    assert scheduler.run_pending(time.time() + 50 * 3600) == 2
+    assert statuses(filename) == ["expired", "expired"]
@@ -3,11 +3,25 @@ import json
 import os
 import threading
 import time
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to the in-process lock only
+    fcntl = None
+
+from dedup import DuplicateIndex, dedupe_records, normalize_email, normalize_phone
+
+if TYPE_CHECKING:
+    from search import SkillIndex
+
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
 
 def validate_email(email: str) -> bool:
-    return re.match(r"[^@]+@[^@]+\.[^@]+", email)
+    return _EMAIL_RE.match(email) is not None
 
 def validate_phone(phone: str) -> bool:
     return phone.isdigit() and len(phone) >= 10
@@ -16,6 +30,30 @@ def validate_phone(phone: str) -> bool:
 _save_operations = {}
 _save_lock = threading.Lock()
 
+# Serializes the read-modify-write of the candidates file across threads
+_write_lock = threading.Lock()
+
+@contextmanager
+def _storage_lock(filename: str):
+    """Hold the lock guarding a candidates file and its deadline index.
+    
+    _write_lock covers threads in this process; an flock on <file>.lock
+    covers app.py, api.py and scheduler.py running as separate processes.
+    """
+    with _write_lock:
+        if fcntl is None:
+            yield
+            return
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
 def _cleanup_old_operations():
     """Clean up old save operations (older than 30 seconds)"""
     current_time = time.time()
@@ -30,37 +68,63 @@ def _cleanup_old_operations():
         _save_operations.pop(key, None)
 
 def _generate_candidate_key(data: Dict[str, Any]) -> str:
-    """Generate a unique key for the candidate based on email and phone"""
-    email = data.get('email', '').lower().strip()
-    phone = data.get('phone', '').strip()
+    """Generate a unique key for the candidate based on canonical email and phone"""
+    email = normalize_email(data.get('email', ''))
+    phone = normalize_phone(data.get('phone', ''))
     return f"{email}|{phone}"
 
-def _is_duplicate_candidate(candidates: List[Dict], new_data: Dict[str, Any]) -> bool:
-    """Check if candidate already exists in the list"""
-    new_email = new_data.get('email', '').lower().strip()
-    new_phone = new_data.get('phone', '').strip()
+# Duplicate index per file, reused across saves while the file is unchanged
+_dedup_indexes: Dict[str, Any] = {}
+
+def _file_signature(filename: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(filename)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+def _get_duplicate_index(filename: str, candidates: List[Dict]) -> DuplicateIndex:
+    """Return the cached index for filename, rebuilding it if the file changed"""
+    signature = _file_signature(filename)
+    cached = _dedup_indexes.get(filename)
+    if cached and cached[0] == signature and len(cached[1]) == len(candidates):
+        return cached[1]
+    index = DuplicateIndex(candidates)
+    _dedup_indexes[filename] = (signature, index)
+    return index
+
+def _is_duplicate_candidate(candidates: List[Dict], new_data: Dict[str, Any],
+                            index: Optional[DuplicateIndex] = None) -> bool:
+    """Check if candidate already exists in the list (exact or fuzzy match)"""
+    if index is None:
+        index = DuplicateIndex(candidates)
     
-    if not new_email and not new_phone:
+    match = index.find(new_data)
+    if match is None:
         return False
     
-    for existing in candidates:
-        existing_email = existing.get('email', '').lower().strip()
-        existing_phone = existing.get('phone', '').strip()
-        
-        # Check for email match (if both have emails)
-        if new_email and existing_email and new_email == existing_email:
-            print(f"⚠️ Duplicate found: Email {new_email} already exists")
-            return True
-        
-        # Check for phone match (if both have phones)
-        if new_phone and existing_phone and new_phone == existing_phone:
-            print(f"⚠️ Duplicate found: Phone {new_phone} already exists")
-            return True
-    
-    return False
+    existing, reason = match
+    print(f"⚠️ Duplicate found ({reason}): matches {existing.get('email', '')} | {existing.get('phone', '')}")
+    return True
+
+# Outcomes of save_candidate
+SAVE_SAVED = "saved"
+SAVE_DUPLICATE = "duplicate"
+SAVE_IN_PROGRESS = "in_progress"
+SAVE_FAILED = "failed"
 
 def save_candidate_data(data: Dict[str, Any], filename: str = "data/candidates.json") -> Optional[str]:
-    """Save candidate data to JSON file with duplicate prevention and thread safety"""
+    """Save candidate data to JSON file with duplicate prevention and thread safety.
+    
+    Returns the filename unless the save failed; use save_candidate to
+    tell a duplicate or an in-progress save apart from a real write.
+    """
+    if save_candidate(data, filename) == SAVE_FAILED:
+        return None
+    return filename
+
+def save_candidate(data: Dict[str, Any], filename: str = "data/candidates.json") -> str:
+    """Save candidate data and return the outcome (one of the SAVE_* values)"""
     
     # Generate unique key for this candidate
     candidate_key = _generate_candidate_key(data)
@@ -75,57 +139,67 @@ def save_candidate_data(data: Dict[str, Any], filename: str = "data/candidates.j
             time_diff = current_time - _save_operations[candidate_key]
             if time_diff < 10:  # 10 seconds timeout
                 print(f"⚠️ Save operation already in progress for this candidate, skipping...")
-                return filename
+                return SAVE_IN_PROGRESS
         
         # Mark this operation as in progress
         _save_operations[candidate_key] = current_time
     
     try:
-        # Create data directory if it doesn't exist
-        os.makedirs("data", exist_ok=True)
-        
-        # Initialize candidates list
-        candidates = []
-        
-        # Try to read existing data - handle all possible errors
-        if os.path.exists(filename):
+        with _storage_lock(filename):
+            # Create data directory if it doesn't exist
+            os.makedirs("data", exist_ok=True)
+            
+            # Initialize candidates list
+            candidates = []
+            
+            # Try to read existing data - handle all possible errors
+            if os.path.exists(filename):
+                try:
+                    with open(filename, "r", encoding='utf-8') as f:
+                        file_content = f.read().strip()
+                        if file_content:  # File has content
+                            candidates = json.loads(file_content)
+                        # If file is empty, candidates remains []
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    print("⚠️ Existing file corrupted, starting fresh")
+                    candidates = []
+            
+            # Check for duplicates in existing data
+            index = _get_duplicate_index(filename, candidates)
+            if _is_duplicate_candidate(candidates, data, index):
+                print(f"❌ Candidate already exists, not saving duplicate")
+                return SAVE_DUPLICATE
+            
+            # Add enhanced data
+            enhanced_data = {
+                **data,
+                "candidate_id": uuid.uuid4().hex,
+                "timestamp": datetime.now().isoformat(),
+                "status": "questions_sent",
+                "submission_deadline": (datetime.now() + timedelta(hours=48)).isoformat(),
+                "assessment_email": "talentscout.tech.assessment@gmail.com"
+            }
+            
+            candidates.append(enhanced_data)
+            
+            # Save to file with atomic write (write to temp file first, then rename)
+            _write_candidates(filename, candidates)
+            
+            # Keep the duplicate index in step with the file we just wrote
+            index.add(enhanced_data)
+            _dedup_indexes[filename] = (_file_signature(filename), index)
+            
+            # Queue the status transitions for the deadline scheduler and
+            # publish the new record on the change feed
             try:
-                with open(filename, "r", encoding='utf-8') as f:
-                    file_content = f.read().strip()
-                    if file_content:  # File has content
-                        candidates = json.loads(file_content)
-                    # If file is empty, candidates remains []
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                print("⚠️ Existing file corrupted, starting fresh")
-                candidates = []
-        
-        # Check for duplicates in existing data
-        if _is_duplicate_candidate(candidates, data):
-            print(f"❌ Candidate already exists, not saving duplicate")
-            return filename
-        
-        # Add enhanced data
-        enhanced_data = {
-            **data,
-            "timestamp": datetime.now().isoformat(),
-            "status": "questions_sent",
-            "submission_deadline": (datetime.now() + timedelta(hours=48)).isoformat(),
-            "assessment_email": "talentscout.tech.assessment@gmail.com"
-        }
-        
-        candidates.append(enhanced_data)
-        
-        # Save to file with atomic write (write to temp file first, then rename)
-        temp_filename = filename + ".tmp"
-        with open(temp_filename, "w", encoding='utf-8') as f:
-            json.dump(candidates, f, indent=2, ensure_ascii=False)
-        
-        # Atomic rename (prevents corruption if interrupted)
-        os.replace(temp_filename, filename)
-        
-        print(f"✅ Candidate data saved successfully!")
-        return filename
-        
+                _append_deadline_entries(filename, [enhanced_data])
+                _append_changes(filename, [{"op": "insert", "record": enhanced_data}])
+            except OSError as e:
+                print(f"⚠️ Could not update deadline index or change log: {str(e)}")
+            
+            print(f"✅ Candidate data saved successfully!")
+            return SAVE_SAVED
+            
     except Exception as e:
         print(f"❌ Error saving candidate data: {str(e)}")
         # Try to save to backup file
@@ -136,13 +210,272 @@ def save_candidate_data(data: Dict[str, Any], filename: str = "data/candidates.j
             print(f"💾 Saved to backup file: {backup_filename}")
         except:
             pass
-        return None
+        return SAVE_FAILED
     
     finally:
         # Clean up the operation flag
         with _save_lock:
             _save_operations.pop(candidate_key, None)
 
+# Deadline index: an append-only JSON-lines file of [due timestamp, candidate_id, status]
+# entries next to the candidates file, read by scheduler.py
+REMINDER_BEFORE = timedelta(hours=12)
+
+# Statuses each scheduled status may replace
+STATUS_TRANSITIONS = {
+    "reminder_due": {"questions_sent"},
+    "expired": {"questions_sent", "reminder_due"},
+}
+
+def deadline_index_path(filename: str = "data/candidates.json") -> str:
+    """Path of the deadline index belonging to a candidates file"""
+    return os.path.splitext(filename)[0] + ".deadlines.jsonl"
+
+def _deadline_entries(candidate: Dict[str, Any]) -> List[list]:
+    """Scheduled transitions for a candidate still waiting on a submission"""
+    status = candidate.get('status')
+    candidate_id = candidate.get('candidate_id')
+    if not candidate_id or status not in STATUS_TRANSITIONS["expired"]:
+        return []
+    try:
+        deadline = datetime.fromisoformat(candidate['submission_deadline'])
+    except (KeyError, TypeError, ValueError):
+        return []
+    
+    entries = [[deadline.timestamp(), candidate_id, "expired"]]
+    if status == "questions_sent":
+        entries.insert(0, [(deadline - REMINDER_BEFORE).timestamp(), candidate_id, "reminder_due"])
+    return entries
+
+def _append_deadline_entries(filename: str, candidates: List[Dict[str, Any]]) -> None:
+    lines = [json.dumps(entry) + "\n" for c in candidates for entry in _deadline_entries(c)]
+    if lines:
+        with open(deadline_index_path(filename), "a", encoding='utf-8') as f:
+            f.writelines(lines)
+
+def rebuild_deadline_index(filename: str = "data/candidates.json") -> int:
+    """Rebuild the deadline index with a full scan; returns the number of entries.
+    
+    Only needed once for files written before the index existed. Records
+    without a candidate_id are given one.
+    """
+    with _storage_lock(filename):
+        candidates = load_candidate_data(filename)
+        missing_ids = [c for c in candidates if not c.get('candidate_id')]
+        for candidate in missing_ids:
+            candidate['candidate_id'] = uuid.uuid4().hex
+        if missing_ids:
+            _write_candidates(filename, candidates)
+            _reset_changes(filename)
+        
+        entries = sorted(entry for c in candidates for entry in _deadline_entries(c))
+        _write_deadline_index(filename, entries)
+        return len(entries)
+
+def prune_deadline_index(filename: str = "data/candidates.json", before: float = 0) -> Tuple[List[list], int]:
+    """Drop index entries due at or before `before`.
+    
+    Returns the remaining entries and the index size they cover, both taken
+    under the storage lock, so a reader can resume tailing from that offset
+    without skipping entries appended afterwards.
+    """
+    with _storage_lock(filename):
+        entries = _read_deadline_index(filename)
+        remaining = [entry for entry in entries if entry[0] > before]
+        if len(remaining) != len(entries):
+            _write_deadline_index(filename, remaining)
+        try:
+            size = os.path.getsize(deadline_index_path(filename))
+        except OSError:
+            size = 0
+        return remaining, size
+
+def _read_deadline_index(filename: str) -> List[list]:
+    entries = []
+    try:
+        with open(deadline_index_path(filename), "r", encoding='utf-8') as f:
+            for line in f:
+                if line.endswith("\n"):
+                    entries.append(json.loads(line))
+    except FileNotFoundError:
+        pass
+    return entries
+
+def _write_deadline_index(filename: str, entries: List[list]) -> None:
+    path = deadline_index_path(filename)
+    with open(path + ".tmp", "w", encoding='utf-8') as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries)
+    os.replace(path + ".tmp", path)
+
+def _write_candidates(filename: str, candidates: List[Dict[str, Any]]) -> None:
+    """Atomically replace the candidates file"""
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, "w", encoding='utf-8') as f:
+        json.dump(candidates, f, indent=2, ensure_ascii=False)
+    os.replace(temp_filename, filename)
+
+def _read_candidates(filename: str) -> List[Dict[str, Any]]:
+    """Load the candidates file, raising on read or parse errors (unlike load_candidate_data)"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+    except FileNotFoundError:
+        return []
+    return json.loads(content) if content else []
+
+def update_candidate_statuses(updates: Dict[str, str], filename: str = "data/candidates.json") -> int:
+    """Apply status changes keyed by candidate_id in a single write.
+    
+    A change is only applied when STATUS_TRANSITIONS allows it from the
+    candidate's current status, so replaying an update is harmless.
+    Returns the number of candidates changed; raises if the candidates
+    file cannot be read, so the caller keeps the updates for a retry.
+    """
+    if not updates:
+        return 0
+    
+    with _storage_lock(filename):
+        signature = _file_signature(filename)
+        candidates = _read_candidates(filename)
+        changes = []
+        for candidate in candidates:
+            new_status = updates.get(candidate.get('candidate_id'))
+            if new_status and candidate.get('status') in STATUS_TRANSITIONS.get(new_status, ()):
+                candidate['status'] = new_status
+                changes.append({"op": "update", "candidate_id": candidate['candidate_id'],
+                                "fields": {"status": new_status}})
+        
+        changed = len(changes)
+        if changed:
+            _write_candidates(filename, candidates)
+            _append_changes(filename, changes)
+            # Statuses do not affect the duplicate index, so keep it warm
+            cached = _dedup_indexes.get(filename)
+            if cached and cached[0] == signature:
+                _dedup_indexes[filename] = (_file_signature(filename), cached[1])
+        return changed
+
+# Change log: an append-only JSON-lines file next to the candidates file.
+# A change's sequence number is the log offset just past its line, so
+# sequence numbers are monotonic across processes and readers resume with
+# a single seek. Ops are "insert" (record), "update" (candidate_id, fields)
+# and "reset" (the file was rewritten; reload it).
+# A reset truncates the log to a single reset line carrying the sequence the
+# old log ended at ("base"); offsets in the new log count from there, so the
+# log stays bounded while sequence numbers keep increasing.
+def changes_log_path(filename: str = "data/candidates.json") -> str:
+    """Path of the change log belonging to a candidates file"""
+    return os.path.splitext(filename)[0] + ".changes.jsonl"
+
+def _append_changes(filename: str, changes: List[Dict[str, Any]]) -> None:
+    data = "".join(json.dumps(change, ensure_ascii=False) + "\n" for change in changes)
+    # One write in append mode, so concurrent writers never interleave lines
+    with open(changes_log_path(filename), "a", encoding='utf-8') as f:
+        f.write(data)
+
+def _reset_changes(filename: str) -> None:
+    """Truncate the change log to one reset entry (caller holds _storage_lock)"""
+    line = json.dumps({"op": "reset", "base": get_change_sequence(filename)}) + "\n"
+    path = changes_log_path(filename)
+    with open(path + ".tmp", "w", encoding='utf-8') as f:
+        f.write(line)
+    os.replace(path + ".tmp", path)
+
+def _log_base(f) -> Tuple[int, int]:
+    """(base sequence, header length) of an open change log"""
+    first = f.readline()
+    if first.startswith(b'{"op": "reset", "base": ') and first.endswith(b"\n"):
+        return int(json.loads(first)["base"]), len(first)
+    return 0, 0
+
+def get_change_sequence(filename: str = "data/candidates.json") -> int:
+    """Current end of the change feed"""
+    try:
+        with open(changes_log_path(filename), "rb") as f:
+            base, _ = _log_base(f)
+            return base + os.fstat(f.fileno()).st_size
+    except OSError:
+        return 0
+
+def get_changes(since: int = 0, filename: str = "data/candidates.json") -> Tuple[List[Dict[str, Any]], int]:
+    """Return (changes after sequence `since`, new sequence)"""
+    reset = []
+    try:
+        with open(changes_log_path(filename), "rb") as f:
+            base, header = _log_base(f)
+            size = os.fstat(f.fileno()).st_size
+            if not base <= since <= base + size:
+                # The log was truncated or replaced; the caller must reload everything
+                reset, since = [{"op": "reset"}], base + header
+            f.seek(since - base)
+            chunk = f.read()
+    except FileNotFoundError:
+        return [], 0
+    
+    # Stop at the last complete line; a partial one is read next time
+    end = chunk.rfind(b"\n") + 1
+    changes = [json.loads(line) for line in chunk[:end].splitlines() if line.strip()]
+    return reset + changes, since + end
+
+class CandidateFeed:
+    """Candidates list kept current by polling the change log.
+    
+    The first refresh loads the whole file; later refreshes only read
+    changes newer than the last seen sequence and merge them in.
+    """
+    
+    def __init__(self, filename: str = "data/candidates.json"):
+        self.filename = filename
+        self.candidates: List[Dict[str, Any]] = []
+        self.sequence: Optional[int] = None
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def _reload(self) -> None:
+        # Take the sequence first: changes racing the load are replayed, and
+        # merging by candidate_id makes the replay harmless
+        self.sequence = get_change_sequence(self.filename)
+        self.candidates = load_candidate_data(self.filename)
+        self._positions = {c['candidate_id']: i for i, c in enumerate(self.candidates)
+                           if c.get('candidate_id')}
+        _skill_indexes.pop(self.filename, None)
+    
+    def refresh(self) -> int:
+        """Merge new changes into the cached candidates; returns changes applied"""
+        with self._lock:
+            if self.sequence is None:
+                self._reload()
+                return len(self.candidates)
+            
+            changes, self.sequence = get_changes(self.sequence, self.filename)
+            for change in changes:
+                op = change.get('op')
+                if op == "reset":
+                    self._reload()
+                    return len(changes)
+                if op == "insert":
+                    record = change['record']
+                    position = self._positions.get(record.get('candidate_id'))
+                    if position is None:
+                        self._positions[record['candidate_id']] = len(self.candidates)
+                        self.candidates.append(record)
+                    else:
+                        self.candidates[position] = record
+                elif op == "update":
+                    position = self._positions.get(change.get('candidate_id'))
+                    if position is not None:
+                        self.candidates[position].update(change.get('fields', {}))
+            return len(changes)
+    
+    def search(self, job_description: str = "", required: List[str] = (),
+               min_experience: float = 0, limit: int = 20) -> List[Tuple[Dict[str, Any], float]]:
+        """Rank the cached candidates against a job description; returns (candidate, score)"""
+        # Under the feed's lock so the list cannot change between indexing and lookup
+        with self._lock:
+            index = get_skill_index(self.candidates, self.filename)
+            results = index.search(job_description, required, min_experience, limit)
+            return [(self.candidates[position], score) for position, score in results]
+
 def load_candidate_data(filename: str = "data/candidates.json") -> List[Dict[str, Any]]:
     """Load all candidate data from JSON file"""
     try:
@@ -159,10 +492,30 @@ def load_candidate_data(filename: str = "data/candidates.json") -> List[Dict[str
         print(f"❌ Error loading candidate data: {str(e)}")
         return []
 
-def get_latest_candidates(limit: int = 10) -> List[Dict[str, Any]]:
+# Skill index per file, extended incrementally as candidates are appended
+_skill_indexes: Dict[str, "SkillIndex"] = {}
+_skill_index_lock = threading.Lock()
+
+def get_skill_index(candidates: Optional[List[Dict[str, Any]]] = None,
+                    filename: str = "data/candidates.json") -> "SkillIndex":
+    """Get the skill search index for filename, indexing any new candidates"""
+    # Imported here so NumPy stays off the import path of app.py workers
+    from search import SkillIndex
+    
+    if candidates is None:
+        candidates = load_candidate_data(filename)
+    with _skill_index_lock:
+        index = _skill_indexes.get(filename)
+        if index is None:
+            index = _skill_indexes[filename] = SkillIndex()
+        return index.sync(candidates)
+
+def get_latest_candidates(limit: int = 10,
+                          candidates: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
     """Get the most recent candidates"""
     try:
-        candidates = load_candidate_data()
+        if candidates is None:
+            candidates = load_candidate_data()
         if not candidates:
             return []
         # Sort by timestamp (most recent first)
@@ -175,46 +528,26 @@ def get_latest_candidates(limit: int = 10) -> List[Dict[str, Any]]:
 def remove_duplicates_from_file(filename: str = "data/candidates.json") -> int:
     """Remove duplicates from existing candidates file and return count of duplicates removed"""
     try:
-        candidates = load_candidate_data(filename)
-        if not candidates:
-            return 0
-        
-        unique_candidates = []
-        seen_emails = set()
-        seen_phones = set()
-        duplicates_count = 0
-        
-        for candidate in candidates:
-            email = candidate.get('email', '').lower().strip()
-            phone = candidate.get('phone', '').strip()
+        with _storage_lock(filename):
+            candidates = load_candidate_data(filename)
+            if not candidates:
+                return 0
             
-            is_duplicate = False
+            unique_candidates, duplicates = dedupe_records(candidates)
+            duplicates_count = len(duplicates)
             
-            # Check email duplicate
-            if email and email in seen_emails:
-                is_duplicate = True
+            for duplicate, kept, reason in duplicates:
+                print(f"Removing duplicate ({reason}): {duplicate.get('email', '')} | {duplicate.get('phone', '')}")
             
-            # Check phone duplicate
-            if phone and phone in seen_phones:
-                is_duplicate = True
+            # Save cleaned data back to file
+            if duplicates_count > 0:
+                _write_candidates(filename, unique_candidates)
+                _dedup_indexes.pop(filename, None)
+                _skill_indexes.pop(filename, None)
+                _reset_changes(filename)
+                print(f"✅ Removed {duplicates_count} duplicates from {filename}")
             
-            if is_duplicate:
-                duplicates_count += 1
-                print(f"Removing duplicate: {email} | {phone}")
-            else:
-                unique_candidates.append(candidate)
-                if email:
-                    seen_emails.add(email)
-                if phone:
-                    seen_phones.add(phone)
-        
-        # Save cleaned data back to file
-        if duplicates_count > 0:
-            with open(filename, "w", encoding='utf-8') as f:
-                json.dump(unique_candidates, f, indent=2, ensure_ascii=False)
-            print(f"✅ Removed {duplicates_count} duplicates from {filename}")
-        
-        return duplicates_count
+            return duplicates_count
         
     except Exception as e:
         print(f"❌ Error removing duplicates: {str(e)}")